@@ -1,10 +1,20 @@
 import os
 from pathlib import Path
+from typing import Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
 
+try:
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    from plotly_resampler import FigureResampler
+except ImportError:  # pragma: no cover - optional dependency
+    FigureResampler = None
+
 from src.finflow.statement_parsing.pdf_statement_parser import PDFTransactionParser
 
 
@@ -35,8 +45,64 @@ def frequency_label(freq: str) -> str:
     return freq_map.get(base_freq, f"Every {freq}")
 
 
+def change_colors(values: np.ndarray) -> np.ndarray:
+    """Color period-over-period changes green (increase) or red (decrease)."""
+    return np.where(np.asarray(values) >= 0, "green", "red")
+
+
+# ---------------------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------------------
+
+
+def aggregate_time_series(
+    df: pd.DataFrame,
+    freq: str = "M",
+    rolling_window: int = 4,
+) -> Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate absolute transaction amounts per period.
+
+    The derived series are computed with NumPy on the resampled totals. They
+    match pandas' ``diff()``, ``rolling(rolling_window, min_periods=1).mean()``
+    and ``cumsum()``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input DataFrame indexed by datetime.
+    freq : str, optional
+        Resampling frequency (default "M").
+    rolling_window : int, optional
+        Rolling mean window size.
+
+    Returns
+    -------
+    Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        Period index, totals per period, period-over-period change (NaN for
+        the first period), rolling mean of the totals and cumulative totals.
+    """
+    ts = df[PDFTransactionParser.COL_AMOUNT].abs().resample(freq).sum()
+    values = ts.to_numpy(dtype=np.float64)
+
+    change = np.empty_like(values)
+    change[:1] = np.nan
+    np.subtract(values[1:], values[:-1], out=change[1:])
+
+    cumsum = np.cumsum(values)
+
+    # Trailing window sums, summed per window so rounding errors don't build
+    # up over long series; the first periods average over fewer values
+    rolling = np.zeros_like(values)
+    if len(values):
+        rolling = np.convolve(values, np.ones(rolling_window))[: len(values)]
+    rolling /= np.minimum(np.arange(1, len(values) + 1), rolling_window)
+
+    return ts.index, values, change, rolling, cumsum
+
+
 # ---------------------------------------------------------------------
-# Plotting function
+# Plotting functions
 # ---------------------------------------------------------------------
 
 
@@ -45,6 +111,7 @@ def plot_time_series(
     category: str,
     freq: str = "M",
     rolling_window: int = 4,
+    save_path: Optional[Path] = None,
 ) -> None:
     """
     Plot aggregated expenditure time series for a given spending category.
@@ -64,6 +131,9 @@ def plot_time_series(
         Resampling frequency (default "M").
     rolling_window : int, optional
         Rolling mean window size.
+    save_path : Optional[Path], optional
+        If provided, the figure is rendered headlessly and saved to this file
+        instead of being shown in a window.
 
     Returns
     -------
@@ -71,19 +141,23 @@ def plot_time_series(
     """
     freq_name = frequency_label(freq)
 
-    ts = df[PDFTransactionParser.COL_AMOUNT].abs().resample(freq).sum()
-    ts_change = ts.diff()
-    ts_rolling = ts.rolling(window=rolling_window, min_periods=1).mean()
-    ts_cumsum = ts.cumsum()
+    index, ts, ts_change, ts_rolling, ts_cumsum = aggregate_time_series(
+        df, freq=freq, rolling_window=rolling_window
+    )
 
-    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(14, 12))
+    # A figure created outside of pyplot is never attached to a GUI backend
+    if save_path is not None:
+        fig = Figure(figsize=(14, 12), constrained_layout=True)
+    else:
+        fig = plt.figure(figsize=(14, 12), constrained_layout=True)
+    ax1, ax2, ax3 = fig.subplots(3, 1)
     formatter = FuncFormatter(euro_formatter)
 
     # ---- Top plot: totals + rolling mean ----
-    ax1.plot(ts.index, ts.values, marker="o", color="blue", label="Total |Amount|")
+    ax1.plot(index, ts, marker="o", color="blue", label="Total |Amount|")
     ax1.plot(
-        ts_rolling.index,
-        ts_rolling.values,
+        index,
+        ts_rolling,
         color="red",
         linestyle="--",
         label=f"{rolling_window}-period Rolling Mean",
@@ -95,15 +169,15 @@ def plot_time_series(
     ax1.set_ylim((0.0, 1.1 * ts.max()))
 
     # ---- Middle plot: change ----
-    colors = ["green" if x >= 0 else "red" for x in ts_change.values]
-    ax2.bar(ts_change.index, ts_change.values, color=colors, alpha=0.7, width=6)
+    colors = change_colors(ts_change)
+    ax2.bar(index, ts_change, color=colors, alpha=0.7, width=6)
     ax2.set_title(f"{freq_name} Change")
     ax2.grid(True, alpha=0.3)
 
     # ---- Bottom plot: cumulative ----
     ax3.plot(
-        ts_cumsum.index,
-        ts_cumsum.values,
+        index,
+        ts_cumsum,
         color="orange",
         marker="o",
     )
@@ -119,5 +193,120 @@ def plot_time_series(
         fontweight="bold",
     )
 
-    plt.tight_layout(rect=[0, 0, 1, 0.96])
-    plt.show()
+    if save_path is not None:
+        fig.savefig(save_path, dpi=120)
+    else:
+        plt.show()
+
+
+def plot_time_series_resampled(
+    df: pd.DataFrame,
+    category: str,
+    freq: str = "M",
+    rolling_window: int = 4,
+) -> None:
+    """
+    Plot aggregated expenditure time series interactively with Plotly-Resampler.
+
+    Shows the same three plots as ``plot_time_series``, but renders them in a
+    Dash app where the line traces are downsampled to the visible range, so
+    long series (e.g. daily frequency over several years) stay responsive.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input DataFrame indexed by datetime.
+    category : str
+        Spending category name (e.g. "Groceries").
+    freq : str, optional
+        Resampling frequency (default "M").
+    rolling_window : int, optional
+        Rolling mean window size.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ImportError
+        If plotly or plotly-resampler is not installed.
+    """
+    if FigureResampler is None:
+        raise ImportError(
+            "plot_time_series_resampled requires plotly and plotly-resampler"
+        )
+
+    freq_name = frequency_label(freq)
+
+    index, ts, ts_change, ts_rolling, ts_cumsum = aggregate_time_series(
+        df, freq=freq, rolling_window=rolling_window
+    )
+
+    fig = FigureResampler(
+        make_subplots(
+            rows=3,
+            cols=1,
+            subplot_titles=(
+                "Total Expenditure per Period",
+                f"{freq_name} Change",
+                "Cumulative Expenditure Over Time",
+            ),
+        )
+    )
+
+    # ---- Top plot: totals + rolling mean ----
+    fig.add_trace(
+        go.Scattergl(
+            name="Total |Amount|", mode="lines+markers", line={"color": "blue"}
+        ),
+        hf_x=index,
+        hf_y=ts,
+        row=1,
+        col=1,
+    )
+    fig.add_trace(
+        go.Scattergl(
+            name=f"{rolling_window}-period Rolling Mean",
+            mode="lines",
+            line={"color": "red", "dash": "dash"},
+        ),
+        hf_x=index,
+        hf_y=ts_rolling,
+        row=1,
+        col=1,
+    )
+
+    # ---- Middle plot: change ----
+    fig.add_trace(
+        go.Bar(
+            name=f"{freq_name} Change",
+            x=index,
+            y=ts_change,
+            marker_color=change_colors(ts_change),
+            opacity=0.7,
+        ),
+        row=2,
+        col=1,
+    )
+
+    # ---- Bottom plot: cumulative ----
+    fig.add_trace(
+        go.Scattergl(
+            name="Cumulative", mode="lines+markers", line={"color": "orange"}
+        ),
+        hf_x=index,
+        hf_y=ts_cumsum,
+        row=3,
+        col=1,
+    )
+
+    fig.update_yaxes(tickprefix="€", tickformat=",.0f", row=1, col=1)
+    fig.update_yaxes(tickprefix="€", tickformat=",.0f", row=3, col=1)
+    fig.update_xaxes(title_text="Date", row=3, col=1)
+    fig.update_layout(
+        title_text=f"<b>{category} Expenditure Analysis — {freq_name}</b>",
+        height=1000,
+    )
+
+    fig.show_dash()
@@ -1,37 +1,184 @@
-from typing import List
+from functools import lru_cache, reduce
+from typing import List, Optional
+import operator
 import os
+import warnings
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from src.finflow.constants import DATA_FOLDER_ENV
 from src.finflow.statement_parsing.pdf_statement_parser import PDFTransactionParser
 
 
+@lru_cache(maxsize=1)
+def _base_path() -> Path:
+    """
+    Resolve the data folder from the environment.
+
+    The result is cached, so the folder is resolved once per process and
+    later changes to the environment variable are not picked up.
+
+    Raises
+    ------
+    ValueError
+        If the environment variable DATA_FOLDER is not set.
+    """
+    base_folder = os.getenv(DATA_FOLDER_ENV)
+    if not base_folder:
+        raise ValueError(f"Environment variable {DATA_FOLDER_ENV} is not set")
+
+    return Path(base_folder).expanduser().resolve()
+
+
+# Keyword lists up to this size are matched without regex if all are literal
+_MAX_LITERAL_KEYWORDS = 8
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Low-cardinality string columns stored as categoricals
+_CATEGORICAL_COLUMNS = (
+    PDFTransactionParser.COL_CODE,
+    PDFTransactionParser.COL_TRANSACTION_ID,
+    PDFTransactionParser.COL_DESCRIPTION,
+)
+
+
+def _arrow_dtype(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    """
+    Map Arrow types to Arrow-backed pandas dtypes.
+
+    Timestamps are left to pyarrow's default conversion so that the booking
+    date becomes a regular ``DatetimeIndex`` and supports ``resample``.
+    Dictionary-encoded columns become pandas categoricals.
+    """
+    if pa.types.is_timestamp(arrow_type) or pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def _keyword_filter(keywords: List[str]) -> pc.Expression:
+    """
+    Build an Arrow filter expression matching descriptions against keywords.
+
+    A few literal keywords are matched with plain substring searches, which
+    skip regex compilation. Otherwise the keywords are joined into a single
+    pattern evaluated by Arrow's RE2-based regex kernel instead of
+    dispatching to Python's ``re`` per row.
+    """
+    description = pc.field(PDFTransactionParser.COL_DESCRIPTION)
+
+    if len(keywords) <= _MAX_LITERAL_KEYWORDS and not any(
+        _REGEX_METACHARACTERS.intersection(keyword) for keyword in keywords
+    ):
+        return reduce(
+            operator.or_,
+            (pc.match_substring(description, keyword) for keyword in keywords),
+        )
+
+    pattern = "|".join(keywords)
+    return pc.match_substring_regex(description, pattern)
+
+
+def _encode_categoricals(table: pa.Table) -> pa.Table:
+    """
+    Dictionary-encode the low-cardinality string columns of a table.
+    """
+    for column in _CATEGORICAL_COLUMNS:
+        index = table.schema.get_field_index(column)
+        if index < 0 or pa.types.is_dictionary(table.schema.field(index).type):
+            continue
+        table = table.set_column(index, column, table[column].dictionary_encode())
+
+    return table
+
+
 class DataLoader:
     """
     Load transaction data from disk and optionally filter by keywords.
+
+    Parquet files are read directly. CSV files are parsed with pyarrow and
+    cached as a ``.cache.parquet`` sidecar next to them, which is used on
+    subsequent loads as long as it is not older than the CSV file.
     """
 
-    def __init__(self, file_name: str = "transactions.csv"):
+    def __init__(self, file_name: str = "transactions.parquet"):
         """
         Parameters
         ----------
         file_name : str
-            CSV file name containing transaction data.
+            Name of the Parquet or CSV file containing transaction data.
         """
         self.file_name = file_name
 
-        base_folder = os.getenv(DATA_FOLDER_ENV)
-        if not base_folder:
-            raise ValueError(f"Environment variable {DATA_FOLDER_ENV} is not set")
-
-        self.base_path: Path = Path(base_folder).expanduser().resolve()
+        self.base_path: Path = _base_path()
         self.file_path: Path = self.base_path / self.file_name
+        self.is_parquet: bool = self.file_path.suffix.lower() == ".parquet"
+        # Kept apart from parser output such as transactions.parquet, which
+        # must never be overwritten by the cache
+        self.cache_path: Path = self.file_path.with_suffix(".cache.parquet")
+
+    def _cache_is_fresh(self) -> bool:
+        """
+        Check whether the Parquet cache exists and is up to date with the CSV file.
+        """
+        if not self.cache_path.exists():
+            return False
+        if not self.file_path.exists():
+            return True
+        return self.cache_path.stat().st_mtime >= self.file_path.stat().st_mtime
+
+    def _read_table(self, filter_expr: Optional[pc.Expression] = None) -> pa.Table:
+        """
+        Read the transaction table.
+
+        Parquet files are read directly. For CSV files the Parquet cache is
+        preferred; if it is missing or stale, the memory-mapped CSV file is
+        parsed and the cache is (re)written where the folder allows it.
+
+        Parameters
+        ----------
+        filter_expr : Optional[pc.Expression], optional
+            Row filter. On Parquet files it is applied during the scan, so
+            non-matching rows are never materialized.
+
+        Returns
+        -------
+        pa.Table
+            Transaction data as an Arrow table.
+        """
+        if self.is_parquet:
+            return pq.read_table(self.file_path, filters=filter_expr)
+        if self._cache_is_fresh():
+            return pq.read_table(self.cache_path, filters=filter_expr)
+
+        # Map the file instead of reading it through a user-space buffer
+        with pa.memory_map(str(self.file_path), "r") as source:
+            table = pacsv.read_csv(
+                source,
+                convert_options=pacsv.ConvertOptions(
+                    column_types={
+                        PDFTransactionParser.COL_BOOKING_DATE: pa.timestamp("ns")
+                    }
+                ),
+            )
+        try:
+            pq.write_table(table, self.cache_path)
+        except OSError as exc:
+            # The cache is optional, e.g. in a read-only data folder
+            warnings.warn(f"Could not write Parquet cache {self.cache_path}: {exc}")
+
+        if filter_expr is not None:
+            table = table.filter(filter_expr)
+
+        return table
 
     def load(self, keywords: List[str] = []) -> pd.DataFrame:
         """
-        Load transactions from CSV and optionally filter by description keywords.
+        Load transactions from disk and optionally filter by description keywords.
 
         Parameters
         ----------
@@ -42,19 +189,14 @@ class DataLoader:
         Returns
         -------
         pd.DataFrame
-            Transaction data indexed by booking date.
+            Transaction data indexed by booking date, with code, transaction
+            ID and description stored as categoricals.
         """
-        df = pd.read_csv(self.file_path, index_col=False)
+        table = self._read_table(_keyword_filter(keywords) if keywords else None)
 
-        df[PDFTransactionParser.COL_BOOKING_DATE] = pd.to_datetime(
-            df[PDFTransactionParser.COL_BOOKING_DATE]
-        )
-        df = df.set_index(PDFTransactionParser.COL_BOOKING_DATE)
+        table = _encode_categoricals(table)
 
-        if keywords:
-            pattern = "|".join(keywords)
-            df = df[
-                df[PDFTransactionParser.COL_DESCRIPTION].str.contains(pattern, na=False)
-            ]
+        df = table.to_pandas(types_mapper=_arrow_dtype)
+        df = df.set_index(PDFTransactionParser.COL_BOOKING_DATE)
 
         return df
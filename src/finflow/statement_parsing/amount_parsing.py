@@ -0,0 +1,109 @@
+from typing import List
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+# Whether the compiled kernel is available
+HAS_NUMBA: bool = njit is not None
+
+_MINUS = ord("-")
+_DOT = ord(".")
+_COMMA = ord(",")
+_ZERO = ord("0")
+_NINE = ord("9")
+
+# Mantissas with more digits could overflow int64
+_MAX_DIGITS = 18
+
+
+def _parse_de_amounts_kernel(buf: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Parse German-formatted amounts stored back to back in a byte buffer.
+
+    String ``i`` occupies ``buf[offsets[i]:offsets[i + 1]]``. Digits are
+    accumulated into an integer mantissa, '.' is skipped as thousands
+    separator and a single ',' marks the decimal point, so the result equals
+    ``float`` on the normalized string. Malformed strings yield NaN.
+    """
+    n = len(offsets) - 1
+    out = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        start = offsets[i]
+        end = offsets[i + 1]
+
+        negative = False
+        if start < end and buf[start] == _MINUS:
+            negative = True
+            start += 1
+
+        mantissa = 0
+        digits = 0
+        decimals = 0
+        seen_comma = False
+        valid = True
+
+        for j in range(start, end):
+            c = int(buf[j])
+            if _ZERO <= c <= _NINE:
+                mantissa = mantissa * 10 + (c - _ZERO)
+                digits += 1
+                if seen_comma:
+                    decimals += 1
+            elif c == _DOT:
+                continue
+            elif c == _COMMA and not seen_comma:
+                seen_comma = True
+            else:
+                valid = False
+                break
+
+        if not valid or digits == 0 or digits > _MAX_DIGITS:
+            out[i] = np.nan
+        else:
+            value = mantissa / 10.0**decimals
+            out[i] = -value if negative else value
+
+    return out
+
+
+if HAS_NUMBA:
+    _parse_de_amounts_kernel = njit(cache=True)(_parse_de_amounts_kernel)
+
+
+def parse_de_amounts(amount_strs: List[str]) -> np.ndarray:
+    """
+    Convert German-formatted amount strings to floats in bulk.
+
+    The strings are concatenated into one byte buffer and parsed by a single
+    loop, compiled with Numba when it is installed.
+
+    Examples
+    --------
+    ['-1.234,56', '48,40'] -> array([-1234.56, 48.4])
+
+    Parameters
+    ----------
+    amount_strs : List[str]
+        Amount strings using '.' as thousands separator and ',' as decimal separator.
+
+    Returns
+    -------
+    np.ndarray
+        Parsed amounts as float64, with NaN where conversion fails.
+    """
+    lengths = np.fromiter(map(len, amount_strs), dtype=np.int64, count=len(amount_strs))
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    # Non-ASCII characters become a single '?' byte, keeping the offsets
+    # aligned and making the affected amounts invalid
+    buf = np.frombuffer(
+        "".join(amount_strs).encode("ascii", errors="replace"), dtype=np.uint8
+    )
+
+    return _parse_de_amounts_kernel(buf, offsets)
@@ -1,16 +1,40 @@
 import os
-import datetime as dt
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
 import logging
 
+import numpy as np
 import pandas as pd
 from PyPDF2 import PdfReader
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pragma: no cover - optional dependency
+    pdfium = None
+
 from src.finflow.constants import DATA_FOLDER_ENV
-from src.finflow.statement_parsing.transaction_patterns import TRANSACTION_PATTERNS
+from src.finflow.statement_parsing.amount_parsing import HAS_NUMBA, parse_de_amounts
+from src.finflow.statement_parsing.transaction_patterns import (
+    get_combined_pattern,
+    match_fields,
+)
 from src.finflow.statement_parsing.transaction_types import TransactionType
 
+# Configure logger once at import time, so repeatedly constructed parsers
+# and worker processes share a single handler instead of adding their own
+_LOGGER: logging.Logger = logging.getLogger("TransactionParser")
+if not _LOGGER.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(message)s",
+            "%Y-%m-%d %H:%M:%S",
+        )
+    )
+    _LOGGER.addHandler(_handler)
+
 
 class PDFTransactionParser:
     """
@@ -26,6 +50,8 @@ class PDFTransactionParser:
         Absolute path to the folder containing PDF files.
     transactions : pd.DataFrame
         Combined DataFrame of all parsed transactions.
+    engine : str
+        Text extraction engine, either "pypdfium2" or "pypdf2".
     logger : logging.Logger
         Logger instance used for parser messages.
     """
@@ -40,7 +66,21 @@ class PDFTransactionParser:
     COL_DESCRIPTION: str = "Description"
     COL_AMOUNT: str = "Amount"
 
-    def __init__(self, source_folder: str, log_level: int = logging.INFO) -> None:
+    # Drops thousands separators and turns the decimal comma into a point
+    _AMOUNT_TRANSLATION = str.maketrans({".": None, ",": "."})
+
+    # -------------------------------
+    # Text extraction engines
+    # -------------------------------
+    ENGINE_PYPDFIUM2: str = "pypdfium2"
+    ENGINE_PYPDF2: str = "pypdf2"
+
+    def __init__(
+        self,
+        source_folder: str,
+        log_level: int = logging.INFO,
+        engine: str = ENGINE_PYPDF2,
+    ) -> None:
         """
         Initialize the PDF transaction parser.
 
@@ -50,12 +90,19 @@ class PDFTransactionParser:
             Relative path (to DATA_FOLDER) of the directory containing PDF files.
         log_level : int, optional
             Logging level for the internal logger (default: logging.INFO).
+        engine : str, optional
+            Text extraction engine (default: "pypdf2"). "pypdfium2" is
+            faster and falls back to "pypdf2" if it is not installed.
 
         Raises
         ------
         ValueError
-            If the environment variable DATA_FOLDER is not set.
+            If the environment variable DATA_FOLDER is not set or the
+            engine is not supported.
         """
+        if engine not in (self.ENGINE_PYPDFIUM2, self.ENGINE_PYPDF2):
+            raise ValueError(f"Unsupported PDF engine: {engine}")
+
         base_folder = os.getenv(DATA_FOLDER_ENV)
 
         if not base_folder:
@@ -66,66 +113,102 @@ class PDFTransactionParser:
 
         self.transactions: pd.DataFrame = pd.DataFrame()
 
-        # Configure logger
-        self.logger: logging.Logger = logging.getLogger("TransactionParser")
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                "%(asctime)s [%(levelname)s] %(message)s",
-                "%Y-%m-%d %H:%M:%S",
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-
+        self.logger: logging.Logger = _LOGGER
         self.logger.setLevel(log_level)
 
-    @staticmethod
-    def parse_amount(amount_str: str) -> Optional[float]:
+        if engine == self.ENGINE_PYPDFIUM2 and pdfium is None:
+            self.logger.warning("pypdfium2 is not installed, falling back to PyPDF2.")
+            engine = self.ENGINE_PYPDF2
+        self.engine: str = engine
+
+    @classmethod
+    def parse_amounts(cls, amount_strs: List[str]) -> np.ndarray:
         """
-        Convert a German-formatted amount string to float.
+        Convert German-formatted amount strings to floats.
+
+        Uses the compiled ``parse_de_amounts`` kernel if Numba is installed.
 
         Examples
         --------
-        '-1.234,56' -> -1234.56
+        ['-1.234,56'] -> array([-1234.56])
 
         Parameters
         ----------
-        amount_str : str
-            Amount string using '.' as thousands separator and ',' as decimal separator.
+        amount_strs : List[str]
+            Amount strings using '.' as thousands separator and ',' as decimal separator.
 
         Returns
         -------
-        Optional[float]
-            Parsed amount as float, or None if conversion fails.
+        np.ndarray
+            Parsed amounts as float64, with NaN where conversion fails.
         """
-        try:
-            return float(amount_str.replace(".", "").replace(",", "."))
-        except ValueError:
-            return None
+        if HAS_NUMBA:
+            return parse_de_amounts(list(amount_strs))
+
+        amounts = pd.Series(amount_strs, dtype=object).str.translate(
+            cls._AMOUNT_TRANSLATION
+        )
+        return pd.to_numeric(amounts, errors="coerce").to_numpy(dtype=np.float64)
 
     @staticmethod
-    def parse_date(date_str: str) -> Optional[dt.date]:
+    def parse_dates(date_strs: List[str]) -> np.ndarray:
         """
-        Convert a date string in DD.MM.YYYY format to a datetime.date object.
+        Convert date strings in DD.MM.YYYY format to datetime64 values.
 
         Parameters
         ----------
-        date_str : str
-            Date string in the format DD.MM.YYYY.
+        date_strs : List[str]
+            Date strings in the format DD.MM.YYYY.
 
         Returns
         -------
-        Optional[datetime.date]
-            Parsed date, or None if conversion fails.
+        np.ndarray
+            Parsed dates as datetime64[ns], with NaT where conversion fails.
+        """
+        return pd.to_datetime(date_strs, format="%d.%m.%Y", errors="coerce").to_numpy()
+
+    @staticmethod
+    def iter_page_texts(
+        pdf_path: Union[str, Path], engine: str
+    ) -> Iterator[Optional[str]]:
+        """
+        Extract the text of a PDF file page by page.
+
+        Parameters
+        ----------
+        pdf_path : Union[str, Path]
+            Path to the PDF file.
+        engine : str
+            Text extraction engine, either "pypdfium2" or "pypdf2".
+
+        Yields
+        ------
+        Optional[str]
+            Text of each page. With pypdfium2 its CRLF line endings are
+            normalized to LF; PyPDF2 text is returned as extracted.
         """
+        if engine == PDFTransactionParser.ENGINE_PYPDF2:
+            for page in PdfReader(pdf_path).pages:
+                yield page.extract_text()
+            return
+
+        pdf = pdfium.PdfDocument(pdf_path)
         try:
-            return dt.datetime.strptime(date_str, "%d.%m.%Y").date()
-        except ValueError:
-            return None
+            for page_index in range(len(pdf)):
+                page = pdf[page_index]
+                text_page = page.get_textpage()
+                try:
+                    # PDFium separates lines with CRLF
+                    yield text_page.get_text_range().replace("\r\n", "\n")
+                finally:
+                    text_page.close()
+                    page.close()
+        finally:
+            pdf.close()
 
     def parse_pdf(
         self,
-        pdf_path: str,
+        pdf_path: Union[str, Path],
         transaction_type: Optional[TransactionType] = TransactionType.DIRECT_DEBIT,
     ) -> pd.DataFrame:
         """
@@ -133,7 +216,7 @@ class PDFTransactionParser:
 
         Parameters
         ----------
-        pdf_path : str
+        pdf_path : Union[str, Path]
             Path to the PDF file.
         transaction_type : Optional[TransactionType], optional
             If provided, only transactions of this type are parsed.
@@ -144,55 +227,67 @@ class PDFTransactionParser:
         pd.DataFrame
             DataFrame containing parsed transactions from the PDF.
         """
-        reader = PdfReader(pdf_path)
-        transaction_list: List[dict] = []
+        return self._parse_pdf(pdf_path, transaction_type, self.engine)
+
+    @classmethod
+    def _parse_pdf(
+        cls,
+        pdf_path: Union[str, Path],
+        transaction_type: Optional[TransactionType],
+        engine: str,
+    ) -> pd.DataFrame:
+        """
+        Parse a single PDF file without relying on parser instance state.
+
+        See ``parse_pdf``; the extraction engine is passed explicitly so the
+        method can run in worker processes via ``_parse_one``.
+        """
+        booking_dates: List[str] = []
+        value_dates: List[str] = []
+        transaction_ids: List[str] = []
+        codes: List[str] = []
+        descriptions: List[str] = []
+        amounts: List[str] = []
+
+        # The pattern only depends on the transaction type
+        pattern = get_combined_pattern(transaction_type)
+        if pattern is None:
+            _LOGGER.warning(f"No patterns defined for {transaction_type}.")
+            page_texts: Iterator[Optional[str]] = iter(())
+        else:
+            page_texts = cls.iter_page_texts(pdf_path, engine)
 
-        for page_index, page in enumerate(reader.pages):
-            text: Optional[str] = page.extract_text()
+        for page_index, text in enumerate(page_texts):
             if not text:
-                self.logger.warning(
+                _LOGGER.warning(
                     f"Page {page_index + 1} in {os.path.basename(pdf_path)} "
                     "has no extractable text."
                 )
                 continue
 
-            if transaction_type is not None:
-                pattern_items = [
-                    (transaction_type, p)
-                    for p in TRANSACTION_PATTERNS.get(transaction_type, [])
-                ]
-            else:
-                pattern_items = [
-                    (tx_type, p)
-                    for tx_type, patterns in TRANSACTION_PATTERNS.items()
-                    for p in patterns
-                ]
-
-            for _, pattern in pattern_items:
-                for match in pattern.findall(text):
-                    (
-                        booking_date,
-                        value_date,
-                        transaction_id,
-                        code,
-                        description,
-                        amount_str,
-                    ) = match
-
-                    transaction_list.append(
-                        {
-                            self.COL_BOOKING_DATE: self.parse_date(booking_date),
-                            self.COL_VALUE_DATE: self.parse_date(value_date),
-                            self.COL_TRANSACTION_ID: transaction_id,
-                            self.COL_CODE: code,
-                            self.COL_DESCRIPTION: description.strip(),
-                            self.COL_AMOUNT: self.parse_amount(amount_str),
-                        }
-                    )
-
-        df: pd.DataFrame = pd.DataFrame(transaction_list)
-
-        self.logger.info(
+            for match in pattern.finditer(text):
+                booking_date, value_date, transaction_id, code, description, amount = (
+                    match_fields(match)
+                )
+                booking_dates.append(booking_date)
+                value_dates.append(value_date)
+                transaction_ids.append(transaction_id)
+                codes.append(code)
+                descriptions.append(description.strip())
+                amounts.append(amount)
+
+        df: pd.DataFrame = pd.DataFrame(
+            {
+                cls.COL_BOOKING_DATE: cls.parse_dates(booking_dates),
+                cls.COL_VALUE_DATE: cls.parse_dates(value_dates),
+                cls.COL_TRANSACTION_ID: transaction_ids,
+                cls.COL_CODE: codes,
+                cls.COL_DESCRIPTION: descriptions,
+                cls.COL_AMOUNT: cls.parse_amounts(amounts),
+            }
+        )
+
+        _LOGGER.info(
             f"Parsed {len(df)} transactions from {os.path.basename(pdf_path)}"
         )
 
@@ -201,7 +296,7 @@ class PDFTransactionParser:
     def parse_pdfs(
         self,
         transaction_type: Optional[TransactionType] = TransactionType.DIRECT_DEBIT,
-        output_csv: Optional[Path] = None,
+        output: Optional[Path] = None,
     ) -> pd.DataFrame:
         """
         Parse all PDF files in the source folder and combine the results.
@@ -211,22 +306,45 @@ class PDFTransactionParser:
         transaction_type : Optional[TransactionType], optional
             If provided, only transactions of this type are parsed.
             If None, all supported transaction types are parsed.
-        output_csv : Optional[Path], optional
-            If provided, the combined DataFrame is written to this CSV file.
+        output : Optional[Path], optional
+            If provided, the combined DataFrame is written to this file
+            (relative to DATA_FOLDER). Files ending in ".parquet" are written
+            as zstd-compressed Parquet, any other suffix as CSV.
 
         Returns
         -------
         pd.DataFrame
             Combined DataFrame of all parsed transactions.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the source folder does not exist.
         """
-        all_dfs: List[pd.DataFrame] = []
+        # Path.glob silently yields nothing for a missing folder
+        if not self.source_folder.is_dir():
+            raise FileNotFoundError(f"Source folder {self.source_folder} does not exist")
+
+        # Sorted so that the output order is stable; the pattern also matches
+        # ".PDF", and directories named like PDFs are skipped
+        pdf_paths: List[Path] = sorted(
+            path for path in self.source_folder.glob("*.[pP][dD][fF]") if path.is_file()
+        )
 
-        for filename in os.listdir(self.source_folder):
-            if filename.lower().endswith(".pdf"):
-                pdf_path = os.path.join(self.source_folder, filename)
-                df_pdf = self.parse_pdf(pdf_path, transaction_type=transaction_type)
-                if not df_pdf.empty:
-                    all_dfs.append(df_pdf)
+        # PDF text extraction is CPU-bound, so files are parsed in worker processes
+        with ProcessPoolExecutor() as executor:
+            all_dfs: List[pd.DataFrame] = [
+                df_pdf
+                for df_pdf in executor.map(
+                    _parse_one,
+                    pdf_paths,
+                    repeat(transaction_type),
+                    repeat(self.engine),
+                    repeat(self.logger.level),
+                    chunksize=4,
+                )
+                if not df_pdf.empty
+            ]
 
         if all_dfs:
             self.transactions = pd.concat(all_dfs, ignore_index=True)
@@ -236,17 +354,39 @@ class PDFTransactionParser:
 
         self.logger.info(f"Total transactions parsed: {len(self.transactions)}")
 
-        if output_csv is not None:
-            path_to_output_csv = self.base_path / output_csv
-            self.transactions.to_csv(path_to_output_csv, index=False)
-            self.logger.info(f"Saved transactions to {path_to_output_csv}")
+        if output is not None:
+            path_to_output = self.base_path / output
+            if path_to_output.suffix.lower() == ".parquet":
+                self.transactions.to_parquet(
+                    path_to_output, engine="pyarrow", compression="zstd", index=False
+                )
+            else:
+                self.transactions.to_csv(path_to_output, index=False)
+            self.logger.info(f"Saved transactions to {path_to_output}")
 
         return self.transactions
 
 
+def _parse_one(
+    pdf_path: Union[str, Path],
+    transaction_type: Optional[TransactionType],
+    engine: str,
+    log_level: int,
+) -> pd.DataFrame:
+    """
+    Parse a single PDF file in a worker process of ``parse_pdfs``.
+
+    Only the arguments are pickled, not the parser and its transactions. The
+    log level is set explicitly since loggers are pickled by name only, and
+    spawned workers would otherwise fall back to the root logger's level.
+    """
+    _LOGGER.setLevel(log_level)
+    return PDFTransactionParser._parse_pdf(pdf_path, transaction_type, engine)
+
+
 # -------------------------------
 # Main section
 # -------------------------------
 if __name__ == "__main__":
     parser = PDFTransactionParser(source_folder="financial_reports")
-    transactions = parser.parse_pdfs(output_csv="transactions.csv")
+    transactions = parser.parse_pdfs(output="transactions.parquet")
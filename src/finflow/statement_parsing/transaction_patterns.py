@@ -1,31 +1,148 @@
 # Regex pattern to parse transactions
 import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
 
 from src.finflow.statement_parsing.transaction_types import TransactionType
 
+# Named groups every transaction pattern has to provide
+GROUP_NAMES = (
+    "booking_date",
+    "value_date",
+    "transaction_id",
+    "code",
+    "description",
+    "amount",
+)
+
+# Transfer description: lines up to the creditor ID, never crossing a
+# "Gläubiger-ID:" line or the next booking date, so failed attempts stay linear
+_TRANSFER_DESCRIPTION = r"[^\n]*(?:\n(?!Gläubiger-ID:|\d{2}\.\d{2}\.\d{4}\n)[^\n]*)*"
+
 TRANSACTION_PATTERNS = {
     TransactionType.DIRECT_DEBIT: [
         re.compile(
-            r"(\d{2}\.\d{2}\.\d{4})\r?\n"  # Booking date
-            r"(\d{2}\.\d{2}\.\d{4})Lastschrift /\r?\nBelastung\r?\n"  # Value date / Charge
-            r"([A-Z0-9]+)\r?\n"  # Transaction ID
-            r"((?:[A-Z0-9]+/\d+ ?)+)"  # Codes: numeric after /, optional space after code
-            r"([A-Za-z][\s\S]*?)"  # Description: starts with letter, includes anything (lazy)
-            r"(-?\d{1,3}(?:\.\d{3})*,\d{2})",  # Amount: no space between description end and amount
+            r"(?P<booking_date>\d{2}\.\d{2}\.\d{4})\r?\n"  # Booking date
+            r"(?P<value_date>\d{2}\.\d{2}\.\d{4})Lastschrift /\r?\nBelastung\r?\n"  # Value date / Charge
+            r"(?P<transaction_id>[A-Z0-9]+)\r?\n"  # Transaction ID
+            r"(?P<code>(?:[A-Z0-9]+/\d+ ?)+)"  # Codes: numeric after /, optional space after code
+            r"(?P<description>[A-Za-z][\s\S]*?)"  # Description: starts with letter, includes anything (lazy)
+            r"(?P<amount>-?\d{1,3}(?:\.\d{3})*,\d{2})",  # Amount: no space between description end and amount
             re.DOTALL
         )#,
     ],
     TransactionType.TRANSFER: [
         re.compile(
-            r"(\d{2}\.\d{2}\.\d{4})\n"  # Booking date
-            r"(\d{2}\.\d{2}\.\d{4})Übertrag /\nÜberweisung\n"  # Value date / Charge
-            r"([A-Z0-9]+)\n"  # Transaction ID
-            r"((?:[A-Z0-9]+/\d+ ?)+)"   # Codes (numeric after /)
-            r"(\s*[\s\S]+?)\nGläubiger-ID:\nDE\d{2}ZZZ\d{11}"  # Description (multi-line)
-            r"(-?\d{1,3}(?:\.\d{3})*,\d{2})",  # Amount
+            r"(?P<booking_date>\d{2}\.\d{2}\.\d{4})\n"  # Booking date
+            r"(?P<value_date>\d{2}\.\d{2}\.\d{4})Übertrag /\nÜberweisung\n"  # Value date / Charge
+            r"(?P<transaction_id>[A-Z0-9]+)\n"  # Transaction ID
+            r"(?P<code>(?:[A-Z0-9]+/\d+ ?)+)"   # Codes (numeric after /)
+            r"(?P<description>" + _TRANSFER_DESCRIPTION + ")"  # Description (multi-line)
+            r"\nGläubiger-ID:\nDE\d{2}ZZZ\d{11}"  # Creditor ID
+            r"(?P<amount>-?\d{1,3}(?:\.\d{3})*,\d{2})",  # Amount
             re.DOTALL,
         )
     ],
 }
 
 
+def _combine_patterns(patterns: List[Pattern[str]]) -> Pattern[str]:
+    """
+    Combine several transaction patterns into a single alternation.
+
+    Each pattern becomes an alternative wrapped in the group ``alt<i>``, and
+    its named groups are suffixed with ``_<i>`` since group names have to be
+    unique within one regex.
+    """
+    alternatives = [
+        f"(?P<alt{i}>"
+        + re.sub(r"\(\?P<(\w+)>", rf"(?P<\1_{i}>", pattern.pattern)
+        + ")"
+        for i, pattern in enumerate(patterns)
+    ]
+    flags = 0
+    for pattern in patterns:
+        flags |= pattern.flags
+
+    return _compile("|".join(alternatives), flags)
+
+
+def _compile(pattern: str, flags: int) -> Pattern[str]:
+    """
+    Compile a pattern with RE2 if available, falling back to ``re``.
+
+    RE2 matches in linear time without backtracking, but rejects some
+    features (e.g. the lookaheads of the transfer description), so such
+    patterns use ``re``.
+    """
+    if re2 is not None and not flags & ~(re.DOTALL | re.UNICODE):
+        try:
+            return re2.compile(("(?s)" if flags & re.DOTALL else "") + pattern)
+        except re2.error:
+            pass
+
+    return re.compile(pattern, flags)
+
+
+COMBINED_PATTERNS: Dict[Optional[TransactionType], Pattern[str]] = {
+    tx_type: _combine_patterns(patterns)
+    for tx_type, patterns in TRANSACTION_PATTERNS.items()
+}
+# Patterns of all transaction types, scanned in a single pass
+COMBINED_PATTERNS[None] = _combine_patterns(
+    [p for patterns in TRANSACTION_PATTERNS.values() for p in patterns]
+)
+
+
+def _field_indices(pattern: Pattern[str]) -> Dict[str, Tuple[int, ...]]:
+    """
+    Map each alternative's wrapper group to the indices of its fields.
+
+    The indices of alternative ``alt<i>`` follow the order of ``GROUP_NAMES``.
+    """
+    return {
+        f"alt{i}": tuple(pattern.groupindex[f"{name}_{i}"] for name in GROUP_NAMES)
+        for i in range(sum(name.startswith("alt") for name in pattern.groupindex))
+    }
+
+
+# Field group indices per combined pattern, so matches skip name lookups
+_FIELD_INDICES: Dict[Pattern[str], Dict[str, Tuple[int, ...]]] = {
+    pattern: _field_indices(pattern) for pattern in COMBINED_PATTERNS.values()
+}
+
+
+def get_combined_pattern(
+    transaction_type: Optional[TransactionType],
+) -> Optional[Pattern[str]]:
+    """
+    Return the combined pattern for a transaction type.
+
+    Parameters
+    ----------
+    transaction_type : Optional[TransactionType]
+        Transaction type to match, or None to match all supported types.
+
+    Returns
+    -------
+    Optional[Pattern[str]]
+        Combined pattern, or None if no patterns exist for the type.
+    """
+    return COMBINED_PATTERNS.get(transaction_type)
+
+
+def match_fields(match: "re.Match[str]") -> Tuple[str, ...]:
+    """
+    Extract the transaction fields from a match of a combined pattern.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        Matched strings in the order of ``GROUP_NAMES``.
+    """
+    # The alternative's wrapper group closes last, so it is the last group
+    return match.group(*_FIELD_INDICES[match.re][match.lastgroup])
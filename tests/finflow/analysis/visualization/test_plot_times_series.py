@@ -0,0 +1,43 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.finflow.analysis.visualization.plot_times_series import aggregate_time_series
+from src.finflow.statement_parsing.pdf_statement_parser import PDFTransactionParser
+
+
+class TestAggregateTimeSeries(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        dates = pd.date_range("2021-01-01", "2023-12-31", freq="D")
+        # Skip some days so that resampling produces empty periods
+        dates = dates[rng.random(len(dates)) > 0.2]
+        self.df = pd.DataFrame(
+            {PDFTransactionParser.COL_AMOUNT: -rng.uniform(0.5, 250.0, len(dates)).round(2)},
+            index=dates,
+        )
+
+    def test_matches_pandas(self):
+        """Test that the NumPy aggregation matches the pandas reductions"""
+        for freq, rolling_window in [("D", 4), ("D", 30), ("W", 4), ("W", 200), ("D", 5000)]:
+            with self.subTest(freq=freq, rolling_window=rolling_window):
+                ts = self.df[PDFTransactionParser.COL_AMOUNT].abs().resample(freq).sum()
+
+                index, values, change, rolling, cumsum = aggregate_time_series(
+                    self.df, freq=freq, rolling_window=rolling_window
+                )
+
+                pd.testing.assert_index_equal(index, ts.index)
+                np.testing.assert_allclose(values, ts.to_numpy())
+                np.testing.assert_allclose(change, ts.diff().to_numpy())
+                np.testing.assert_allclose(
+                    rolling,
+                    ts.rolling(window=rolling_window, min_periods=1).mean().to_numpy(),
+                    rtol=1e-12,
+                )
+                np.testing.assert_allclose(cumsum, ts.cumsum().to_numpy())
+
+
+if __name__ == "__main__":
+    unittest.main()
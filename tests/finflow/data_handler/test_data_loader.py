@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.finflow.constants import DATA_FOLDER_ENV
+from src.finflow.data_handler import data_loader
+from src.finflow.data_handler.data_loader import DataLoader
+from src.finflow.statement_parsing.pdf_statement_parser import PDFTransactionParser
+
+COL_ID = PDFTransactionParser.COL_TRANSACTION_ID
+COL_DESCRIPTION = PDFTransactionParser.COL_DESCRIPTION
+
+CSV_TEXT = """Booking Date,Value Date,Transaction ID,Code,Description,Amount
+2024-01-05,2024-01-05,A1,X/1,REWE Markt GmbH,-23.45
+2024-01-12,2024-01-12,A2,X/2,WIENER FEINBACKEREI,-4.10
+2024-02-03,2024-02-03,A3,X/1,SCHECK-IN CENTER Alnature,-61.00
+2024-02-20,2024-02-20,A4,X/3,DWS Alternatives GmbH,-950.00
+2024-03-01,2024-03-01,A5,X/1,rewe lowercase,-1.00
+"""
+
+
+class TestDataLoader(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.folder = Path(tmp_dir.name)
+
+        patcher = mock.patch.dict(os.environ, {DATA_FOLDER_ENV: str(self.folder)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # The resolved data folder is cached per process
+        data_loader._base_path.cache_clear()
+        self.addCleanup(data_loader._base_path.cache_clear)
+
+        self.csv_path = self.folder / "transactions.csv"
+        self.csv_path.write_text(CSV_TEXT)
+
+    def test_csv_cache_written_and_invalidated(self):
+        """Test that the first load writes the sidecar and a newer CSV invalidates it"""
+        loader = DataLoader("transactions.csv")
+        self.assertEqual(len(loader.load()), 5)
+        self.assertTrue(loader.cache_path.exists())
+        cache_mtime = loader.cache_path.stat().st_mtime
+
+        # Older CSV: the cache is still used
+        self.csv_path.write_text(CSV_TEXT + "2024-03-02,2024-03-02,A6,X/1,REWE,-2.00\n")
+        os.utime(self.csv_path, (cache_mtime - 10, cache_mtime - 10))
+        self.assertEqual(len(loader.load()), 5)
+
+        # Newer CSV: the cache is rebuilt
+        os.utime(self.csv_path, (cache_mtime + 10, cache_mtime + 10))
+        self.assertEqual(len(loader.load()), 6)
+        self.assertEqual(pq.read_table(loader.cache_path).num_rows, 6)
+
+    def test_parquet_read_directly(self):
+        """Test that a Parquet file is read directly and never overwritten"""
+        parquet_path = self.folder / "transactions.parquet"
+        pd.read_csv(self.csv_path, parse_dates=["Booking Date"]).to_parquet(
+            parquet_path, index=False
+        )
+        content = parquet_path.read_bytes()
+
+        loader = DataLoader("transactions.parquet")
+        self.assertEqual(len(loader.load(keywords=["REWE"])), 1)
+
+        self.assertEqual(parquet_path.read_bytes(), content)
+        self.assertFalse(loader.cache_path.exists())
+
+    def test_read_only_folder(self):
+        """Test that loading works when the cache cannot be written"""
+        with mock.patch.object(
+            data_loader.pq, "write_table", side_effect=PermissionError("read-only")
+        ), warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            df = DataLoader("transactions.csv").load()
+
+        self.assertEqual(len(df), 5)
+        self.assertEqual(len(caught), 1)
+
+    def test_keyword_filters_match_str_contains(self):
+        """Test that literal and regex filters return the rows of str.contains"""
+        # Parquet input keeps a real null description
+        expected_df = pd.read_csv(self.csv_path, parse_dates=["Booking Date"])
+        expected_df.loc[len(expected_df)] = [
+            pd.Timestamp("2024-03-05"), "2024-03-05", "A6", "X/1", None, -3.0
+        ]
+        expected_df.to_parquet(self.folder / "transactions.parquet", index=False)
+
+        cases = [
+            ["REWE", "SCHECK-IN CENTER Alnature"],  # literal path
+            ["RE.E", "Alnature"],  # regex path
+            ["REWE|FEINBACKEREI"],  # regex path
+            [f"K{i}" for i in range(20)] + ["DWS"],  # too many keywords for literal path
+        ]
+        for file_name in ("transactions.csv", "transactions.parquet"):
+            source = (
+                pd.read_csv(self.csv_path) if file_name.endswith(".csv") else expected_df
+            )
+            for keywords in cases:
+                with self.subTest(file_name=file_name, keywords=keywords):
+                    mask = source[COL_DESCRIPTION].str.contains(
+                        "|".join(keywords), na=False
+                    )
+                    df = DataLoader(file_name).load(keywords=keywords)
+                    self.assertEqual(list(df[COL_ID]), list(source.loc[mask, COL_ID]))
+
+    def test_dtypes(self):
+        """Test that string columns are categorical and the index is datetime"""
+        df = DataLoader("transactions.csv").load()
+
+        self.assertIsInstance(df.index, pd.DatetimeIndex)
+        for column in (PDFTransactionParser.COL_CODE, COL_ID, COL_DESCRIPTION):
+            self.assertIsInstance(df[column].dtype, pd.CategoricalDtype)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+import math
+import unittest
+
+from src.finflow.statement_parsing.amount_parsing import parse_de_amounts
+
+
+class TestParseDeAmounts(unittest.TestCase):
+    def test_valid_amounts(self):
+        """Test that German-formatted amounts are parsed like float()"""
+        amounts = parse_de_amounts(["-1.234,56", "48,40", "0,01", "1.000.000,00", "99"])
+        self.assertEqual(list(amounts), [-1234.56, 48.4, 0.01, 1000000.0, 99.0])
+
+    def test_invalid_amounts(self):
+        """Test that malformed amounts are parsed as NaN"""
+        amounts = parse_de_amounts(["abc", "", "-", "12,3,4", "12ä,00"])
+        self.assertTrue(all(math.isnan(x) for x in amounts))
+
+    def test_empty_input(self):
+        """Test that an empty list yields an empty array"""
+        self.assertEqual(len(parse_de_amounts([])), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from src.finflow.constants import DATA_FOLDER_ENV
+from src.finflow.statement_parsing.pdf_statement_parser import (
+    PDFTransactionParser,
+    pdfium,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+STATEMENT_PDF = FIXTURES / "statement.pdf"
+
+
+class TestPDFTransactionParser(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ, {DATA_FOLDER_ENV: str(FIXTURES)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def parse(self, engine: str) -> pd.DataFrame:
+        parser = PDFTransactionParser(source_folder=".", engine=engine)
+        return parser.parse_pdf(STATEMENT_PDF, transaction_type=None)
+
+    def test_parse_pdf(self):
+        """Test that the statement fixture yields its direct debit and transfer"""
+        df = self.parse(PDFTransactionParser.ENGINE_PYPDF2)
+
+        self.assertEqual(
+            list(df[PDFTransactionParser.COL_TRANSACTION_ID]),
+            ["7L2C1U7N2KRV", "8K3D2V8O3LSW"],
+        )
+        self.assertEqual(list(df[PDFTransactionParser.COL_AMOUNT]), [-48.40, -800.00])
+        self.assertEqual(df[PDFTransactionParser.COL_DESCRIPTION].iloc[1], "Miete Februar")
+
+    def test_parse_pdfs(self):
+        """Test that the source folder is globbed and parsed in worker processes"""
+        parser = PDFTransactionParser(source_folder=".")
+        df = parser.parse_pdfs(transaction_type=None)
+
+        self.assertEqual(
+            list(df[PDFTransactionParser.COL_TRANSACTION_ID]),
+            ["7L2C1U7N2KRV", "8K3D2V8O3LSW"],
+        )
+        self.assertTrue(df[PDFTransactionParser.COL_BOOKING_DATE].is_monotonic_increasing)
+        pd.testing.assert_frame_equal(
+            df.reset_index(drop=True), self.parse(PDFTransactionParser.ENGINE_PYPDF2)
+        )
+
+    def test_parse_pdfs_missing_folder(self):
+        """Test that a missing source folder raises instead of parsing nothing"""
+        parser = PDFTransactionParser(source_folder="missing")
+        with self.assertRaises(FileNotFoundError):
+            parser.parse_pdfs()
+
+    @unittest.skipUnless(pdfium, "pypdfium2 is not installed")
+    def test_engines_agree(self):
+        """Test that pypdfium2 and PyPDF2 produce the same transactions"""
+        pd.testing.assert_frame_equal(
+            self.parse(PDFTransactionParser.ENGINE_PYPDFIUM2),
+            self.parse(PDFTransactionParser.ENGINE_PYPDF2),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,15 @@
 import re
+import time
 import unittest
 
+from src.finflow.statement_parsing.transaction_patterns import (
+    TRANSACTION_PATTERNS,
+    get_combined_pattern,
+    match_fields,
+    re2,
+)
+from src.finflow.statement_parsing.transaction_types import TransactionType
+
 # Transaction regex
 TRANSACTION_PATTERN_TEST = re.compile(
     r"(\d{2}\.\d{2}\.\d{4})\r?\n"                          # Booking date
@@ -44,5 +53,127 @@ class TestTransactionPattern(unittest.TestCase):
         self.assertEqual(groups[6], "-48,40")  # Amount
 
 
+TRANSFER_TEXT = """01.02.2024
+01.02.2024Übertrag /
+Überweisung
+8K3D2V8O3LSW
+6MZO/46853 Miete Februar
+Gläubiger-ID:
+DE12ZZZ12345678901-800,00
+"""
+
+# Transfer header without a creditor ID, so the description has no end marker
+TRANSFER_HEADER = TRANSFER_TEXT.split("Gläubiger-ID:")[0]
+
+
+class TestTransferPattern(unittest.TestCase):
+    def test_transfer_pattern_match(self):
+        """Test that the transfer pattern extracts the description and amount"""
+        pattern = TRANSACTION_PATTERNS[TransactionType.TRANSFER][0]
+        match = pattern.search(TRANSFER_TEXT)
+        self.assertIsNotNone(match, "Pattern did not match the sample text.")
+        self.assertEqual(match.group("description").strip(), "Miete Februar")
+        self.assertEqual(match.group("amount"), "-800,00")
+
+    def test_description_stops_at_creditor_id(self):
+        """Test that the description does not extend past a malformed creditor ID"""
+        malformed = TRANSFER_TEXT.replace(
+            "DE12ZZZ12345678901", "UNKNOWN\nGläubiger-ID:\nDE12ZZZ12345678901"
+        )
+        pattern = TRANSACTION_PATTERNS[TransactionType.TRANSFER][0]
+        self.assertIsNone(pattern.search(malformed))
+
+    def test_description_stops_at_next_transaction(self):
+        """Test that a transfer without creditor ID is not merged into the next one"""
+        pattern = TRANSACTION_PATTERNS[TransactionType.TRANSFER][0]
+        matches = list(pattern.finditer(TRANSFER_HEADER + TRANSFER_TEXT))
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].group("description").strip(), "Miete Februar")
+
+    def test_missing_creditor_id_is_linear(self):
+        """Test that pages without creditor IDs don't trigger quadratic backtracking"""
+        text = TRANSFER_HEADER * 3000
+        for pattern in (
+            TRANSACTION_PATTERNS[TransactionType.TRANSFER][0],
+            get_combined_pattern(None),
+        ):
+            start = time.perf_counter()
+            self.assertIsNone(pattern.search(text))
+            # Well under 0.1 s when linear; the unbounded form took over a minute
+            self.assertLess(time.perf_counter() - start, 2.0)
+
+
+class TestCombinedPattern(unittest.TestCase):
+    def test_combined_pattern_fields(self):
+        """Test that the combined pattern exposes the fields in GROUP_NAMES order"""
+        pattern = get_combined_pattern(TransactionType.DIRECT_DEBIT)
+        matches = list(pattern.finditer(SAMPLE_TEXT))
+        self.assertEqual(len(matches), 1)
+
+        booking_date, value_date, transaction_id, code, description, amount = (
+            match_fields(matches[0])
+        )
+        self.assertEqual(booking_date, "04.12.2024")
+        self.assertEqual(value_date, "04.12.2024")
+        self.assertEqual(transaction_id, "7L2C1U7N2KRV")
+        self.assertEqual(code, "5LYN/35742")
+        self.assertTrue(description.startswith("D.T.NET Service"))
+        self.assertEqual(amount, "-48,40")
+
+    def test_combined_pattern_all_types(self):
+        """Test that the pattern for all types matches the same transaction"""
+        matches = list(get_combined_pattern(None).finditer(SAMPLE_TEXT))
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(match_fields(matches[0])[-1], "-48,40")
+
+    def test_combined_pattern_transfer(self):
+        """Test that fields are read from the matching alternative"""
+        matches = list(get_combined_pattern(None).finditer(SAMPLE_TEXT + TRANSFER_TEXT))
+        self.assertEqual(len(matches), 2)
+
+        _, _, transaction_id, _, description, amount = match_fields(matches[1])
+        self.assertEqual(transaction_id, "8K3D2V8O3LSW")
+        self.assertEqual(description.strip(), "Miete Februar")
+        self.assertEqual(amount, "-800,00")
+
+    def test_combined_description_stops_at_creditor_id(self):
+        """Test that combined patterns don't extend past a malformed creditor ID"""
+        malformed = TRANSFER_TEXT.replace(
+            "DE12ZZZ12345678901", "UNKNOWN\nGläubiger-ID:\nDE12ZZZ12345678901"
+        )
+        for tx_type in (TransactionType.TRANSFER, None):
+            with self.subTest(tx_type=tx_type):
+                self.assertIsNone(get_combined_pattern(tx_type).search(malformed))
+
+    def test_combined_description_stops_at_next_transaction(self):
+        """Test that combined patterns don't merge a transfer without creditor ID"""
+        for tx_type in (TransactionType.TRANSFER, None):
+            with self.subTest(tx_type=tx_type):
+                pattern = get_combined_pattern(tx_type)
+                matches = list(pattern.finditer(TRANSFER_HEADER + TRANSFER_TEXT))
+
+                self.assertEqual(len(matches), 1)
+                description = match_fields(matches[0])[4]
+                self.assertEqual(description.strip(), "Miete Februar")
+
+    def test_unsupported_type_has_no_pattern(self):
+        """Test that transaction types without patterns yield no pattern"""
+        self.assertIsNone(get_combined_pattern(TransactionType.CARD_TRANSACTION))
+
+
+@unittest.skipUnless(re2, "google-re2 is not installed")
+class TestCombinedPatternRE2(TestCombinedPattern):
+    """Runs the combined pattern tests against the RE2-compiled patterns"""
+
+    def setUp(self):
+        self.assertNotIsInstance(
+            get_combined_pattern(TransactionType.DIRECT_DEBIT), re.Pattern
+        )
+        # The transfer description needs lookaheads, which RE2 doesn't support
+        self.assertIsInstance(get_combined_pattern(TransactionType.TRANSFER), re.Pattern)
+        self.assertIsInstance(get_combined_pattern(None), re.Pattern)
+
+
 if __name__ == "__main__":
     unittest.main()